@@ -14,7 +14,7 @@ import sys
 import json
 import yaml
 import dash
-from dash import dcc, html, Input, Output, State, callback_context, ALL
+from dash import dcc, html, Input, Output, State, callback_context, ALL, Patch
 import dash_bootstrap_components as dbc
 import time
 from datetime import datetime
@@ -770,7 +770,7 @@ def create_quick_nav_links():
                     dept
                 ])
             ], 
-            id=f"nav-{dept_id}-link",
+            id={"type": "dept-nav", "index": dept_id},
             className="badge bg-light me-2 mb-2 p-2 text-decoration-none", 
             style={
                 "color": dept_color, 
@@ -1021,33 +1021,15 @@ def toggle_section_collapse(pathname, n_clicks_list, is_open_list):
         new_is_open = list(is_open_list)  # Create a copy
         new_is_open[clicked_index] = not new_is_open[clicked_index]
         
-        # Update styles for all chevrons
-        styles = []
-        for i, is_open in enumerate(new_is_open):
-            # Get the color for this section
-            section_id = section_ids[i]
-            
-            # Find corresponding department name
-            dept_name = next((dept for dept in categories if dept.lower().replace(' ', '-') == section_id), None)
-            color = icon_colors.get(dept_name, company_info.get('theme_color', '#4a6fa5'))
-            
-            # Create style with transform based on state
-            styles.append({
-                "transition": "transform 0.3s, background-color 0.2s",
-                "transform": "rotate(0deg)" if is_open else "rotate(-90deg)",
-                "fontSize": "1.6rem",
-                "color": "white",
-                "backgroundColor": color,
-                "borderRadius": "50%",
-                "width": "32px",
-                "height": "32px",
-                "display": "flex",
-                "alignItems": "center",
-                "justifyContent": "center",
-                "boxShadow": "0 2px 4px rgba(0,0,0,0.15)",
-                "padding": "4px",
-                "opacity": "1.0" if is_open else "0.85"  # Slightly dim when closed
-            })
+        # Only the clicked chevron changes, so patch its style and leave the rest untouched
+        is_open = new_is_open[clicked_index]
+        chevron_patch = Patch()
+        chevron_patch["transform"] = "rotate(0deg)" if is_open else "rotate(-90deg)"
+        chevron_patch["boxShadow"] = "0 2px 4px rgba(0,0,0,0.15)"
+        chevron_patch["opacity"] = "1.0" if is_open else "0.85"  # Slightly dim when closed
+        
+        styles = [dash.no_update] * len(new_is_open)
+        styles[clicked_index] = chevron_patch
         
         return new_is_open, styles
         
@@ -1058,41 +1040,31 @@ def toggle_section_collapse(pathname, n_clicks_list, is_open_list):
 
 # --- Department Navigation Links ---
 
-# First, clear any existing callbacks to avoid conflicts
-for dept in categories:
-    dept_id = dept.lower().replace(' ', '-')
-    try:
-        dash_app.callback_map.pop(f"..nav-{dept_id}-link.n_clicks...url.hash", None)
-    except:
-        pass  # Ignore if callback doesn't exist
-
-# Then create new callbacks with proper closures
-for dept in categories:
-    dept_id = dept.lower().replace(' ', '-')
-    
-    # This immediately invoked function creates a proper closure for each department
-    def create_callback_for_dept(dept_id=dept_id):  # Capture dept_id in function default parameter
-        @dash_app.callback(
-            Output("url", "hash", allow_duplicate=True),
-            [Input(f"nav-{dept_id}-link", "n_clicks")],
-            prevent_initial_call=True
-        )
-        def navigate_to_department(n_clicks):
-            """Navigate to the specified department section"""
-            if n_clicks:
-                return dept_id
-            return dash.no_update
-    
-    # Execute the function immediately to register the callback with the captured dept_id
-    create_callback_for_dept()
+# One pattern-matching callback serves every department's quick nav link
+@dash_app.callback(
+    Output("url", "hash", allow_duplicate=True),
+    [Input({"type": "dept-nav", "index": ALL}, "n_clicks")],
+    prevent_initial_call=True
+)
+def navigate_to_department(n_clicks_list):
+    """Navigate to the clicked department's section"""
+    ctx = callback_context
+    if ctx.triggered and ctx.triggered[0]['value']:
+        return ctx.triggered_id['index']
+    return dash.no_update
 
 # --- Business Areas Navigation ---
 
+# Section ids for each business area, plus shared visibility styles (serialized by value, so safe to reuse)
+business_area_ids = [f"business-area-{area.lower().replace(' ', '-').replace('-', '_')}" for area in business_areas]
+_HIDDEN = {"display": "none"}
+_VISIBLE = {"display": "block"}
+
 # Using a single combined callback instead of individual callbacks
 @dash_app.callback(
-    [Output(f"business-area-{area.lower().replace(' ', '-').replace('-', '_')}", "style") for area in business_areas] + 
+    [Output(area_id, "style") for area_id in business_area_ids] + 
     [Output("business-area-sections", "className")],
-    [Input(f"business-area-{area.lower().replace(' ', '-').replace('-', '_')}-link", "n_clicks") for area in business_areas],
+    [Input(f"{area_id}-link", "n_clicks") for area_id in business_area_ids],
     [State("business-area-sections", "className")]
 )
 def handle_business_area_navigation(*args):
@@ -1104,32 +1076,25 @@ def handle_business_area_navigation(*args):
     # Get all n_clicks arguments (excluding the last state argument)
     n_clicks_list = args[:-1]
     current_class = args[-1]
+    all_hidden = (_HIDDEN,) * len(business_area_ids)
     
     # If no clicks happened yet, hide all sections
     if all(n is None for n in n_clicks_list):
-        return [{"display": "none"} for _ in business_areas] + [current_class]
+        return all_hidden + (current_class,)
     
     # Find which area was clicked by examining the callback context
     ctx = callback_context
     if not ctx.triggered:
-        return [{"display": "none"} for _ in business_areas] + [current_class]
+        return all_hidden + (current_class,)
     
     # Get the ID of the clicked link
     triggered_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
-    # Find which area corresponds to the clicked link
-    area_styles = []
-    for area in business_areas:
-        area_id = f"business-area-{area.lower().replace(' ', '-').replace('-', '_')}"
-        if f"{area_id}-link" == triggered_id:
-            # Show this area
-            area_styles.append({"display": "block"})
-        else:
-            # Hide all other areas
-            area_styles.append({"display": "none"})
+    # Show the area whose link was clicked and hide all others
+    area_styles = tuple(_VISIBLE if f"{area_id}-link" == triggered_id else _HIDDEN for area_id in business_area_ids)
     
     # Return all outputs
-    return area_styles + ["business-area-active"]
+    return area_styles + ("business-area-active",)
 
 # --- Main Entry Point ---
 
@@ -15,9 +15,10 @@ COPILOT INSTRUCTIONS:
 import dash
 from dash import dcc, html
 import dash_bootstrap_components as dbc
-from dash.dependencies import Input, Output
+from dash.dependencies import Input, Output, State
 import yaml
 import os
+from functools import lru_cache
 
 # Import logging utilities
 from utils.log import get_logger, log_activity, setup_logging, log_button_click
@@ -43,6 +44,7 @@ config = load_config()
 # Company and user information
 company_info = config.get('company', {})
 user_info = config.get('user', {})
+DEFAULT_THEME_COLOR = company_info.get('theme_color', '#4a6fa5')
 
 # Initialize the app with a Bootstrap theme and Font Awesome icons
 app_title = f"{company_info.get('name', 'Enterprise')} AI Portal" 
@@ -89,14 +91,13 @@ dash_app.index_string = index_string
 
 server = dash_app.server  # for deployment purposes
 
-# Get departments from config
-departments = [dept['name'] for dept in config.get('departments', [])]
+# Get departments from config, indexed once by name for O(1) lookups
+departments_cfg = config.get('departments', [])
+DEPT_BY_NAME = {dept['name']: dept for dept in departments_cfg}
+departments = [dept['name'] for dept in departments_cfg]
 
 # Create a dictionary of apps for each department
-apps = {}
-for dept in config.get('departments', []):
-    dept_name = dept['name']
-    apps[dept_name] = dept.get('apps', [])
+apps = {dept['name']: dept.get('apps', []) for dept in departments_cfg}
 
 # Add app store apps
 app_store = config.get('app_store', {})
@@ -106,9 +107,7 @@ app_store_description = app_store.get('description', "Discover and install the l
 apps['App Store'] = app_store.get('apps', [])
 
 # Get department descriptions
-dept_descriptions = {}
-for dept in config.get('departments', []):
-    dept_descriptions[dept['name']] = dept.get('description', "")
+dept_descriptions = {dept['name']: dept.get('description', "") for dept in departments_cfg}
 
 # Icon color mapping for different departments
 # Get department colors from config
@@ -144,12 +143,13 @@ def has_contact_info(app):
 def get_contact_href(app):
     """Get the appropriate href value for the contact button."""
     # First check for the combined contact field
-    if app.get('contact'):
-        if app.get('contact').startswith(('http://', 'https://', 'mailto:')):
-            return app.get('contact')
-        elif '@' in app.get('contact', '') and '.' in app.get('contact', '').split('@')[1]:
-            return f"mailto:{app.get('contact')}"
-        return app.get('contact')
+    contact = app.get('contact')
+    if contact:
+        if contact.startswith(('http://', 'https://', 'mailto:')):
+            return contact
+        elif '@' in contact and '.' in contact.split('@')[1]:
+            return f"mailto:{contact}"
+        return contact
     
     # Fallback to separate fields for backward compatibility
     if app.get('contact_url'):
@@ -164,11 +164,18 @@ def get_contact_href(app):
 # Create the app cards with colorful icons
 def create_app_cards(dept):
     cards = []
-    for app in apps.get(dept, []):
+    dept_apps = apps.get(dept, ())
+    # Department color is the same for every card, so resolve it once
+    dept_fallback = icon_colors.get(dept, DEFAULT_THEME_COLOR)
+    for app in dept_apps:
         icon = app.get('icon', 'fa-solid fa-cube')  # Default icon if none specified
         
         # Set icon color based on app name or fall back to department color
-        icon_color = app_icon_colors.get(app['name'], icon_colors.get(dept, company_info.get('theme_color', '#4a6fa5')))
+        icon_color = app_icon_colors.get(app['name'], dept_fallback)
+        
+        # Resolve link availability once and reuse it for every button below
+        has_url = bool((app.get('url') or '').strip())
+        has_contact = bool(has_contact_info(app))
         
         card = dbc.Card([
             dbc.CardBody([
@@ -197,7 +204,7 @@ def create_app_cards(dept):
                             color="primary", 
                             href=app['url'], 
                             target="_blank",
-                            className="me-2 flex-grow-1") if 'url' in app and app['url'] and app['url'].strip() else None,
+                            className="me-2 flex-grow-1") if has_url else None,
                             
                             # Contact button - can be URL or mailto based on contact field value
                             dbc.Button([
@@ -207,8 +214,8 @@ def create_app_cards(dept):
                             color="info", 
                             href=get_contact_href(app),
                             target="_blank",
-                            className="flex-grow-1" if not ('url' in app and app['url'] and app['url'].strip()) else "",
-                            disabled=not has_contact_info(app)),
+                            className="flex-grow-1" if not has_url else "",
+                            disabled=not has_contact),
                             
                             # Fallback button if neither URL nor contact info is provided
                             dbc.Button([
@@ -217,8 +224,7 @@ def create_app_cards(dept):
                             ], 
                             color="secondary", 
                             disabled=True, 
-                            className="w-100") if not (('url' in app and app['url'] and app['url'].strip()) or 
-                                                     (app.get('contact_url') or app.get('contact_email') or app.get('email'))) else None
+                            className="w-100") if not (has_url or has_contact) else None
                         ], className="d-flex")
                     ])
                 ], className="d-flex flex-column h-100") # Make the div take full height of card
@@ -280,9 +286,9 @@ navbar = dbc.Navbar(
                         # Department navigation menu
                         dbc.DropdownMenu(
                             [dbc.DropdownMenuItem(
-                                [html.I(className=f"{config.get('departments', [])[i].get('icon', 'fa-solid fa-folder')} me-2"), dept], 
+                                [html.I(className=f"{DEPT_BY_NAME[dept].get('icon', 'fa-solid fa-folder')} me-2"), dept], 
                                 href=f"#{dept.lower()}"
-                             ) for i, dept in enumerate(departments)],
+                             ) for dept in departments],
                             label="Departments",
                             nav=True,
                             className="mx-2"
@@ -305,54 +311,61 @@ navbar = dbc.Navbar(
     sticky="top",
 )
 
+# Section header styles - static parts are shared, the gradient is cached per department
+_SECTION_ICON_STYLE = {
+    "color": "white", 
+    "fontSize": "1.8rem",
+    "filter": "drop-shadow(0 2px 3px rgba(0,0,0,0.2))"
+}
+_SECTION_ICON_CONTAINER_STYLE = {
+    "display": "flex",
+    "alignItems": "center",
+    "justifyContent": "center",
+    "width": "48px",
+    "height": "48px",
+    "borderRadius": "50%",
+    "background": "rgba(255, 255, 255, 0.2)",
+    "backdropFilter": "blur(5px)",
+    "boxShadow": "inset 0 0 0 1px rgba(255, 255, 255, 0.2)"
+}
+_SECTION_TITLE_STYLE = {
+    "color": "white", 
+    "margin": "0",
+    "fontWeight": "600",
+    "textShadow": "0 1px 2px rgba(0, 0, 0, 0.15)",
+    "letterSpacing": "0.5px"
+}
+
+@lru_cache(maxsize=None)
+def _section_header_style(dept):
+    """Return the gradient header style for a department, built once per department."""
+    # Set icon color based on department
+    icon_color = icon_colors.get(dept, DEFAULT_THEME_COLOR)
+    return {
+        "background": f"linear-gradient(135deg, {icon_color}, {icon_color}dd, {icon_color}00)",
+        "boxShadow": "0 4px 15px rgba(0, 0, 0, 0.08), inset 0 -1px 0 rgba(255, 255, 255, 0.15)",
+        "borderLeft": "5px solid rgba(255, 255, 255, 0.7)",
+        "marginBottom": "1rem",
+        "position": "relative",
+        "overflow": "hidden"
+    }
+
 # Section headers with colorful icons
 def create_section_header(title, icon, id_name, dept=None):
-    # Set icon color based on department
-    icon_color = icon_colors.get(dept, company_info.get('theme_color', '#4a6fa5'))
-    
     return html.Div([
         html.Div([
             # Icon container with glass-morphism effect
             html.Div([
-                html.I(className=f"{icon}", 
-                       style={
-                           "color": "white", 
-                           "fontSize": "1.8rem",
-                           "filter": "drop-shadow(0 2px 3px rgba(0,0,0,0.2))"
-                       })
+                html.I(className=f"{icon}", style=_SECTION_ICON_STYLE)
             ],
-            style={
-                "display": "flex",
-                "alignItems": "center",
-                "justifyContent": "center",
-                "width": "48px",
-                "height": "48px",
-                "borderRadius": "50%",
-                "background": "rgba(255, 255, 255, 0.2)",
-                "backdropFilter": "blur(5px)",
-                "boxShadow": "inset 0 0 0 1px rgba(255, 255, 255, 0.2)"
-            },
+            style=_SECTION_ICON_CONTAINER_STYLE,
             className="me-3"),
             
             # Title with enhanced typography
-            html.H2(title, 
-                   style={
-                       "color": "white", 
-                       "margin": "0",
-                       "fontWeight": "600",
-                       "textShadow": "0 1px 2px rgba(0, 0, 0, 0.15)",
-                       "letterSpacing": "0.5px"
-                   })
+            html.H2(title, style=_SECTION_TITLE_STYLE)
         ], 
         className="d-flex align-items-center p-3 rounded",
-        style={
-            "background": f"linear-gradient(135deg, {icon_color}, {icon_color}dd, {icon_color}00)",
-            "boxShadow": "0 4px 15px rgba(0, 0, 0, 0.08), inset 0 -1px 0 rgba(255, 255, 255, 0.15)",
-            "borderLeft": "5px solid rgba(255, 255, 255, 0.7)",
-            "marginBottom": "1rem",
-            "position": "relative",
-            "overflow": "hidden"
-        }),
+        style=_section_header_style(dept)),
     ], id=id_name)
 
 # Create quick navigation links
@@ -360,9 +373,9 @@ def create_quick_nav_links():
     links = []
     
     # Add department section links
-    for i, dept in enumerate(departments):
-        dept_icon = config.get('departments', [])[i].get('icon', 'fa-solid fa-folder')
-        dept_color = icon_colors.get(dept, company_info.get('theme_color', '#4a6fa5'))
+    for dept in departments:
+        dept_icon = DEPT_BY_NAME[dept].get('icon', 'fa-solid fa-folder')
+        dept_color = icon_colors.get(dept, DEFAULT_THEME_COLOR)
         
         links.append(
             html.A([
@@ -371,7 +384,7 @@ def create_quick_nav_links():
                     dept
                 ])
             ], 
-            id=f"nav-{dept.lower().replace(' ', '-')}-link",
+            id={"type": "dept-nav", "index": dept.lower()},
             className="badge bg-light me-2 mb-2 p-2 text-decoration-none", 
             style={
                 "color": dept_color, 
@@ -384,54 +397,59 @@ def create_quick_nav_links():
     
     return links
 
-# Main content layout - App Store first as a non-section element, then department apps
-content = html.Div(
-    [
-        # AI App Store section (first, but not as a section)
-        html.Div([
-            # Banner image
-            html.Img(src=app_store.get('banner_image', 'assets/images/app-store-banner.svg'), 
-                    className="img-fluid mb-3 rounded",
-                    alt="AI App Store Banner",
-                    style={"maxWidth": "100%"}),
-            
-            # Title with enhanced styling
+# Main content layout - App Store first as a non-section element, then department apps.
+# Built once; with gunicorn --preload the tree is shared copy-on-write by all workers.
+@lru_cache(maxsize=1)
+def _build_content():
+    return html.Div(
+        [
+            # AI App Store section (first, but not as a section)
             html.Div([
-                html.I(className=f"{app_store_icon} me-3", style={"color": icon_colors.get("App Store"), "fontSize": "2.2rem"}),
-                html.H1(app_store_title, className="d-inline m-0", 
-                      style={"fontWeight": "700", "color": "#1565C0", "letterSpacing": "0.5px"})
-            ], className="d-flex align-items-center mb-3"),
+                # Banner image
+                html.Img(src=app_store.get('banner_image', 'assets/images/app-store-banner.svg'), 
+                        className="img-fluid mb-3 rounded",
+                        alt="AI App Store Banner",
+                        style={"maxWidth": "100%"}),
             
-            # Description and cards
-            html.Div([
-                html.P(app_store_description, className="lead mb-3"),
+                # Title with enhanced styling
+                html.Div([
+                    html.I(className=f"{app_store_icon} me-3", style={"color": icon_colors.get("App Store"), "fontSize": "2.2rem"}),
+                    html.H1(app_store_title, className="d-inline m-0", 
+                          style={"fontWeight": "700", "color": "#1565C0", "letterSpacing": "0.5px"})
+                ], className="d-flex align-items-center mb-3"),
+            
+                # Description and cards
+                html.Div([
+                    html.P(app_store_description, className="lead mb-3"),
                 
+                    dbc.Row([
+                        dbc.Col(card, md=4) for card in create_app_cards('App Store')
+                    ], className="g-4")
+                ])
+            ], className="mb-5 p-4"),
+        ] + [
+            # Department apps sections
+            html.Div([
+                create_section_header(
+                    f"{dept} AI Applications",
+                    DEPT_BY_NAME[dept].get('icon', 'fa-solid fa-folder'),
+                    f"{dept.lower()}",
+                    dept
+                ),
+                html.P(dept_descriptions.get(dept, ""), className="lead mb-4"),
                 dbc.Row([
-                    dbc.Col(card, md=4) for card in create_app_cards('App Store')
+                    dbc.Col(card, md=4) for card in create_app_cards(dept)
                 ], className="g-4")
-            ])
-        ], className="mb-5 p-4"),
-    ] + [
-        # Department apps sections
-        html.Div([
-            create_section_header(
-                f"{dept} AI Applications",
-                next((d.get('icon', 'fa-solid fa-folder') for d in config.get('departments', []) if d['name'] == dept), 'fa-solid fa-folder'),
-                f"{dept.lower()}",
-                dept
-            ),
-            html.P(dept_descriptions.get(dept, ""), className="lead mb-4"),
-            dbc.Row([
-                dbc.Col(card, md=4) for card in create_app_cards(dept)
-            ], className="g-4")
-        ], 
-        className="mb-5 p-4") for dept in departments
-    ],
-    className="container",
-    style={
-        "padding": "1rem",
-    },
-)
+            ], 
+            className="mb-5 p-4") for dept in departments
+        ],
+        className="container",
+        style={
+            "padding": "1rem",
+        },
+    )
+
+content = _build_content()
 
 # Footer with company information
 footer = html.Footer(
@@ -473,26 +491,13 @@ dash_app.layout = html.Div([
 @dash_app.callback(
     Output("navbar-collapse", "is_open"),
     [Input("navbar-toggler", "n_clicks")],
-    [dash.dependencies.State("navbar-collapse", "is_open")],
+    [State("navbar-collapse", "is_open")],
 )
 def toggle_navbar_collapse(n, is_open):
     if n:
         return not is_open
     return is_open
 
-# Department navigation links
-for dept in departments:
-    # Create a dynamic callback for each department
-    @dash_app.callback(
-        Output("url", "hash"),
-        [Input(f"nav-{dept.lower().replace(' ', '-')}-link", "n_clicks")],
-        prevent_initial_call=True
-    )
-    def navigate_to_department(n_clicks, dept_name=dept):
-        if n_clicks:
-            return dept_name.lower()
-        return dash.no_update
-
 # Add client-side JavaScript for smooth scrolling
 dash_app.clientside_callback(
     """
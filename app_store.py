@@ -15,28 +15,31 @@ COPILOT INSTRUCTIONS:
 
 import dash
 import dash_bootstrap_components as dbc
+import flask
 from dash import dcc, html
 from dash.dependencies import Input, Output, State
-import yaml
 import os
+import json
 import random
 import time
 from datetime import datetime
+from functools import lru_cache
+from plotly.utils import PlotlyJSONEncoder
 
 # Import logging utilities
 from utils.log import get_logger, log_activity, log_performance, log_button_click
+from utils.portal_utils import load_config as shared_load_config
 
 # Set up logger for this application
 logger = get_logger('app_store')
 logger.info("Starting Enterprise AI Portal - App Store Inspired Version")
 
-# Load configuration from YAML file
+# Load configuration from YAML file through the process-wide shared loader
 def load_config():
     start_time = time.time()
     config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
     try:
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
+        config = shared_load_config(config_path)
         execution_time = time.time() - start_time
         log_performance("load_config", execution_time)
         logger.info(f"Configuration loaded successfully in {execution_time:.4f}s")
@@ -53,7 +56,11 @@ user_info = config.get('user', {})
 
 # Initialize the app with a Bootstrap theme and Font Awesome icons
 app_title = f"{company_info.get('name', 'Enterprise')} AI Portal (App Store)" 
+# The App Store styles are served from static/ under this portal's prefix rather
+# than assets/, which Dash would auto-include in every other portal as well
+server = flask.Flask(__name__, static_url_path="/portal-4/static")
 app = dash.Dash(__name__, 
+                server=server,
                 external_stylesheets=[
                     dbc.themes.BOOTSTRAP,
                     "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css"
@@ -67,303 +74,23 @@ app = dash.Dash(__name__,
                 url_base_pathname="/portal-4/",
                 suppress_callback_exceptions=True)
 
-# Add favicon - explicitly set to override Dash default
-app._favicon = None  # Disable default Dash favicon
-
-# Add our own favicon to the index template
-index_string = '''
-<!DOCTYPE html>
-<html>
-    <head>
-        {%metas%}
-        <title>{%title%}</title>
+# Replace Dash's default favicon with our own plus CDN preconnects (crossorigin
+# only for cdnjs, whose webfonts are CORS fetches), and link the App Store styles
+# after {%css%} so they still override Bootstrap and assets/custom.css
+app.index_string = app.index_string.replace('{%favicon%}', """<link rel="preconnect" href="https://cdn.jsdelivr.net">
+        <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
         <link rel="icon" type="image/svg+xml" href="/assets/images/favicon.svg">
-        <link rel="shortcut icon" type="image/x-icon" href="/assets/favicon.ico">
-        {%css%}
-        <style>
-            /* Apple-inspired styles */
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif;
-                background-color: #f8f8f8;
-                color: #1d1d1f;
-            }
-            
-            .app-card {
-                border-radius: 12px;
-                overflow: hidden;
-                transition: transform 0.2s ease, box-shadow 0.2s ease;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                background-color: white;
-                height: 100%;
-            }
-            
-            .app-card:hover {
-                transform: translateY(-4px);
-                box-shadow: 0 6px 12px rgba(0,0,0,0.15);
-            }
-            
-            .featured-app {
-                height: 340px;
-                position: relative;
-                border-radius: 12px;
-                overflow: hidden;
-                background-color: white;
-                transition: transform 0.2s ease, box-shadow 0.2s ease;
-                box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-            }
-            
-            .featured-app:hover {
-                transform: translateY(-4px) scale(1.01);
-                box-shadow: 0 8px 16px rgba(0,0,0,0.2);
-            }
-            
-            .featured-overlay {
-                position: absolute;
-                bottom: 0;
-                left: 0;
-                right: 0;
-                padding: 20px;
-                background: linear-gradient(to top, rgba(0,0,0,0.8), transparent);
-                color: white;
-            }
-            
-            .collection-title {
-                font-weight: 700;
-                font-size: 22px;
-                margin-bottom: 16px;
-                margin-top: 20px;
-                padding-left: 12px;
-                display: flex;
-                align-items: center;
-            }
-            
-            .collection-title i {
-                margin-right: 10px;
-            }
-            
-            .horizontal-scroll {
-                display: flex;
-                overflow-x: auto;
-                padding-bottom: 20px;
-                margin-bottom: 20px;
-                -webkit-overflow-scrolling: touch;
-                scroll-behavior: smooth;
-                scrollbar-width: none;  /* Firefox */
-            }
-            
-            .horizontal-scroll::-webkit-scrollbar {
-                display: none;  /* Chrome, Safari, Edge */
-            }
-            
-            .scroll-item {
-                flex: 0 0 auto;
-                width: 280px;
-                margin-right: 16px;
-            }
-            
-            .scroll-item-small {
-                flex: 0 0 auto;
-                width: 200px;
-                margin-right: 16px;
-            }
-            
-            .scroll-item-large {
-                flex: 0 0 auto;
-                width: 400px;
-                margin-right: 16px;
-            }
-            
-            .today-card {
-                border-radius: 16px;
-                height: 400px;
-                background-size: cover;
-                background-position: center;
-                position: relative;
-                box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-                transition: transform 0.3s ease;
-            }
-            
-            .today-card:hover {
-                transform: scale(1.02);
-            }
-            
-            .today-overlay {
-                position: absolute;
-                bottom: 0;
-                left: 0;
-                right: 0;
-                padding: 25px;
-                background: linear-gradient(to top, rgba(0,0,0,0.9) 0%, rgba(0,0,0,0.7) 40%, transparent 100%);
-                color: white;
-                border-bottom-left-radius: 16px;
-                border-bottom-right-radius: 16px;
-            }
-            
-            .tag {
-                display: inline-block;
-                padding: 4px 12px;
-                background-color: rgba(0,122,255,0.1);
-                color: #007AFF;
-                border-radius: 100px;
-                font-weight: 500;
-                font-size: 12px;
-                margin-bottom: 8px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-            
-            .nav-tabs {
-                border-bottom: none;
-                margin-bottom: 20px;
-            }
-            
-            .nav-tabs .nav-link {
-                border: none;
-                color: #6c757d;
-                font-weight: 600;
-                padding: 12px 16px;
-                transition: color 0.2s ease;
-            }
-            
-            .nav-tabs .nav-link.active {
-                color: #007AFF;
-                border-bottom: 2px solid #007AFF;
-                background-color: transparent;
-            }
-            
-            .nav-tabs .nav-link:hover {
-                color: #007AFF;
-                border-color: transparent;
-            }
-            
-            .navbar {
-                box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-                background-color: rgba(255, 255, 255, 0.8);
-                backdrop-filter: blur(10px);
-                -webkit-backdrop-filter: blur(10px);
-            }
-            
-            .btn-get {
-                background-color: #007AFF;
-                color: white;
-                border-radius: 100px;
-                padding: 6px 16px;
-                font-weight: 600;
-                border: none;
-                font-size: 14px;
-            }
-            
-            .btn-get:hover {
-                background-color: #0056b3;
-                color: white;
-            }
-            
-            .app-icon {
-                width: 64px;
-                height: 64px;
-                border-radius: 16px;
-                margin-right: 12px;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }
-            
-            .app-title {
-                font-weight: 600;
-                margin-bottom: 4px;
-            }
-            
-            .app-subtitle {
-                color: #6c757d;
-                font-size: 14px;
-            }
-            
-            .footer {
-                background-color: #f8f8f8;
-                border-top: 1px solid #e1e1e1;
-            }
-
-            /* Bottom tab bar styling */
-            .bottom-tab-bar {
-                position: fixed;
-                bottom: 0;
-                left: 0;
-                right: 0;
-                background-color: rgba(255, 255, 255, 0.9);
-                backdrop-filter: blur(10px);
-                -webkit-backdrop-filter: blur(10px);
-                box-shadow: 0 -1px 5px rgba(0,0,0,0.1);
-                z-index: 1000;
-                padding: 8px 0;
-                display: flex;
-                justify-content: space-around;
-                border-top: 1px solid #e1e1e1;
-            }
-            
-            .tab-item {
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                color: #8e8e93;
-                text-decoration: none;
-                font-size: 10px;
-                transition: color 0.2s ease;
-                padding: 5px 0;
-            }
-            
-            .tab-item i {
-                font-size: 22px;
-                margin-bottom: 4px;
-            }
-            
-            .tab-item.active {
-                color: #007AFF;
-            }
-            
-            .tab-item:hover {
-                color: #007AFF;
-                text-decoration: none;
-            }
-
-            /* Add padding to account for the bottom tab bar */
-            .content-container {
-                padding-bottom: 75px;
-            }
-
-            /* App rating stars */
-            .rating {
-                color: #ff9500;
-                font-size: 12px;
-                display: flex;
-                align-items: center;
-            }
-            
-            .rating-count {
-                color: #8e8e93;
-                margin-left: 5px;
-                font-size: 12px;
-            }
-        </style>
-    </head>
-    <body>
-        {%app_entry%}
-        <footer>
-            {%config%}
-            {%scripts%}
-            {%renderer%}
-        </footer>
-    </body>
-</html>
-'''
-
-app.index_string = index_string
-
-server = app.server  # for deployment purposes
+        <link rel="shortcut icon" type="image/x-icon" href="/assets/favicon.ico">""").replace(
+    '{%css%}', """{%css%}
+        <link rel="stylesheet" href="/portal-4/static/app_store.css">""")
 
 # Get departments from config
-departments = [dept['name'] for dept in config.get('departments', [])]
+departments_cfg = config.get('departments', [])
+departments = [dept['name'] for dept in departments_cfg]
 
 # Create a dictionary of apps for each department
 apps_by_dept = {}
-for dept in config.get('departments', []):
+for dept in departments_cfg:
     dept_name = dept['name']
     apps_by_dept[dept_name] = dept.get('apps', [])
 
@@ -374,13 +101,33 @@ app_store_icon = app_store.get('icon', "fa-solid fa-store")
 app_store_description = app_store.get('description', "Discover and install the latest AI applications")
 apps_by_dept['App Store'] = app_store.get('apps', [])
 
-# Combine all apps into a single list for "All Apps" tab
-all_apps = []
+# Private, fixed-seed generator for the demo data, so every worker shows the same picks
+_rng = random.Random(0)
+
+# Demo ratings and download counts for every app, generated in one pass each
+app_count = sum(len(dept_apps) for dept_apps in apps_by_dept.values())
+app_ratings = [round(_rng.uniform(3.5, 5.0), 1) for _ in range(app_count)]
+app_downloads = [_rng.randint(100, 10000) for _ in range(app_count)]
+
+# Every app shares the same demo release date, so format it once
+release_date = datetime.now().strftime("%b %d, %Y")
+
+# Enhance apps with department and display metadata. The config dicts are shared
+# with other loaders in the process, so each department gets its own copies.
+app_metadata = zip(app_ratings, app_downloads)
 for dept_name, dept_apps in apps_by_dept.items():
-    for app_item in dept_apps:
-        app_copy = app_item.copy()
-        app_copy['department'] = dept_name
-        all_apps.append(app_copy)
+    apps_by_dept[dept_name] = [
+        dict(app_item, department=dept_name, rating=rating, downloads=downloads,
+             release_date=release_date,
+             short_desc=app_item.get('description', '').split(' - ', 1)[0])
+        for app_item, (rating, downloads) in zip(dept_apps, app_metadata)
+    ]
+
+# Combine all apps into a single list for "All Apps" tab
+all_apps = [app_item for dept_apps in apps_by_dept.values() for app_item in dept_apps]
+
+# Fallback icon color for departments without their own
+DEFAULT_THEME_COLOR = company_info.get('theme_color', '#4a6fa5')
 
 # Icon color mapping for different departments
 icon_colors = {
@@ -392,28 +139,11 @@ icon_colors = {
     'App Store': '#1565C0',
 }
 
+# Department icons indexed by name
+dept_icons = {dept['name']: dept.get('icon', 'fa-solid fa-folder') for dept in departments_cfg}
+
 # Randomly select featured apps (one from each department)
-featured_apps = []
-for dept_name, dept_apps in apps_by_dept.items():
-    if dept_apps:  # If department has apps
-        app_item = random.choice(dept_apps)
-        app_copy = app_item.copy()
-        app_copy['department'] = dept_name
-        featured_apps.append(app_copy)
-
-# Function to generate random rating for demo purposes
-def generate_rating():
-    return round(random.uniform(3.5, 5.0), 1)
-
-def generate_downloads():
-    return random.randint(100, 10000)
-
-# Enhance apps with additional metadata for display
-for app_list in apps_by_dept.values():
-    for app_item in app_list:
-        app_item['rating'] = generate_rating()
-        app_item['downloads'] = generate_downloads()
-        app_item['release_date'] = datetime.now().strftime("%b %d, %Y")
+featured_apps = [_rng.choice(dept_apps) for dept_apps in apps_by_dept.values() if dept_apps]
 
 # User profile dropdown
 user_dropdown = dbc.DropdownMenu(
@@ -483,13 +213,47 @@ navbar = dbc.Navbar(
     sticky="top",
 )
 
+# Rating star icons are identical on every card, so share one instance of each
+_FULL_STAR = html.I(className="fas fa-star")
+_HALF_STAR = html.I(className="fas fa-star-half-alt")
+_EMPTY_STAR = html.I(className="far fa-star")
+
+# The disabled INFO button has no per-app fields, so it is shared the same way
+_INFO_BUTTON = html.Button("INFO", className="btn-disabled w-100", disabled=True)
+
+# Card styles shared by every card instead of rebuilt per app
+_CARD_ICON_STYLE = {"color": "white"}
+_SHORT_DESC_STYLE = {
+    "overflow": "hidden", 
+    "textOverflow": "ellipsis", 
+    "display": "-webkit-box", 
+    "WebkitLineClamp": "2", 
+    "WebkitBoxOrient": "vertical"
+}
+
+# Only a handful of department colors exist, so share one style dict per color
+@lru_cache(maxsize=None)
+def _background_style(color):
+    return {"backgroundColor": color}
+
+# Cards already built, keyed by department and app name. The same app shows up
+# in several collections, so each card only needs to be built once.
+_APP_CARDS = {}
+
 # Create app-store inspired card
 def create_app_card(app_item, dept=None):
+    key = (app_item.get('department', dept), app_item['name'])
+    card = _APP_CARDS.get(key)
+    if card is None:
+        card = _APP_CARDS[key] = _build_app_card(app_item, dept)
+    return card
+
+def _build_app_card(app_item, dept=None):
     icon = app_item.get('icon', 'fa-solid fa-cube')
     department = app_item.get('department', dept)
     
     # Set icon color based on department
-    icon_color = icon_colors.get(department, company_info.get('theme_color', '#4a6fa5'))
+    icon_color = icon_colors.get(department, DEFAULT_THEME_COLOR)
     
     # Determine if we should show Launch App button, Contact Me button, or both
     has_url = 'url' in app_item and app_item.get('url', '').strip()
@@ -527,10 +291,7 @@ def create_app_card(app_item, dept=None):
         )
     else:
         # Fallback if neither are available
-        button_content = html.Button("INFO", 
-            className="btn-disabled w-100",
-            disabled=True
-        )
+        button_content = _INFO_BUTTON
     
     return html.Div([
         dbc.Card([
@@ -539,36 +300,25 @@ def create_app_card(app_item, dept=None):
                     # App icon and info
                     html.Div([
                         html.Div(
-                            html.I(className=f"{icon} fa-2x", style={"color": "white"}),
+                            html.I(className=f"{icon} fa-2x", style=_CARD_ICON_STYLE),
                             className="app-icon d-flex align-items-center justify-content-center",
-                            style={"backgroundColor": icon_color}
+                            style=_background_style(icon_color)
                         ),
                         html.Div([
                             html.H6(app_item['name'], className="app-title"),
                             html.Div(department, className="app-subtitle"),
                             # Rating stars
                             html.Div([
-                                html.Div([
-                                    html.I(className="fas fa-star"),
-                                    html.I(className="fas fa-star"),
-                                    html.I(className="fas fa-star"),
-                                    html.I(className="fas fa-star"),
-                                    html.I(className="fas fa-star-half-alt" if app_item['rating'] % 1 >= 0.5 else "far fa-star"),
-                                ], className="rating"),
+                                html.Div(
+                                    [_FULL_STAR] * 4 + [_HALF_STAR if app_item['rating'] % 1 >= 0.5 else _EMPTY_STAR],
+                                    className="rating"),
                                 html.Span(f"{app_item['rating']} ({int(app_item['downloads']/100)})", className="rating-count")
                             ], className="d-flex align-items-center")
                         ])
                     ], className="d-flex mb-3"),
                     
                     # Description - limited to 2 lines with ellipsis
-                    html.P(app_item['description'].split(' - ')[0], className="mb-3", 
-                           style={
-                               "overflow": "hidden", 
-                               "textOverflow": "ellipsis", 
-                               "display": "-webkit-box", 
-                               "WebkitLineClamp": "2", 
-                               "WebkitBoxOrient": "vertical"
-                           }),
+                    html.P(app_item['short_desc'], className="mb-3", style=_SHORT_DESC_STYLE),
                     
                     # Button section
                     button_content
@@ -583,7 +333,7 @@ def create_featured_app_card(app_item):
     department = app_item.get('department', 'App')
     
     # Set icon color based on department
-    icon_color = icon_colors.get(department, company_info.get('theme_color', '#4a6fa5'))
+    icon_color = icon_colors.get(department, DEFAULT_THEME_COLOR)
     
     return html.Div([
         html.Div([
@@ -614,7 +364,7 @@ def create_featured_app_card(app_item):
             html.Div([
                 html.Span("FEATURED APP", className="tag"),
                 html.H3(app_item['name'], className="mb-2 text-white"),
-                html.P(app_item['description'].split(' - ')[0], className="text-white-50"),
+                html.P(app_item['short_desc'], className="text-white-50"),
                 html.Button("GET", className="btn-get mt-2")
             ], className="featured-overlay")
         ], className="featured-app")
@@ -662,8 +412,13 @@ def create_tab_content():
             dbc.Tab(label="Apps", tab_id="tab-apps", labelClassName="px-4"),
         ], id="main-tabs", active_tab="tab-today", className="mb-4"),
         
-        # Tab content area
-        html.Div(id="tab-content", className="mb-5"),
+        # Tab content area - both main tabs are rendered once and shown or hidden,
+        # so switching tabs never re-sends their trees
+        html.Div([
+            html.Div(_TODAY_LAYOUT, id="today-content", style=_VISIBLE),
+            html.Div(_APPS_LAYOUT, id="apps-content", style=_HIDDEN),
+            html.Div(id="category-content"),
+        ], id="tab-content", className="mb-5"),
     ])
 
 # Bottom tab bar (Apple App Store style)
@@ -717,6 +472,94 @@ footer = html.Footer(
     className="footer"
 )
 
+# Tab content only depends on the config loaded at import, so build it once
+# instead of on every tab switch
+_HIDDEN = {"display": "none"}
+_VISIBLE = {"display": "block"}
+
+# Today tab - featured content and editorial
+_TODAY_LAYOUT = html.Div([
+    # Hero section
+    html.Div([
+        html.Div([
+            html.Span("WELCOME TO", className="tag"),
+            html.H1(app_store_title, className="display-5 mb-3 text-white"),
+            html.P(app_store_description, className="lead text-white-50"),
+        ], className="col-md-8 py-5 px-4")
+    ], className="mb-4 rounded-3", style={
+        "background": "linear-gradient(135deg, #1565C0 0%, #0D47A1 100%)",
+        "borderRadius": "12px"
+    }),
+    
+    # Today's picks
+    html.H3("Today's Picks", className="collection-title mb-4"),
+    html.Div([
+        create_today_card("AI for Finance", "Optimize your financial operations with these AI-powered tools", "#2E7D32"),
+        create_today_card("Marketing Intelligence", "Enhance your marketing strategies with AI insights", "#C62828"),
+        create_today_card("Smarter Operations", "Streamline your operations with intelligent automation", "#0277BD")
+    ], className="horizontal-scroll px-2"),
+    
+    # Featured apps section
+    html.H3("Featured Apps", className="collection-title mb-4 mt-4"),
+    html.Div([
+        create_featured_app_card(app_item) for app_item in featured_apps[:3]
+    ], className="horizontal-scroll px-2"),
+    
+    # Editor's choice
+    create_app_collection("Editor's Choice", _rng.sample(all_apps, min(6, len(all_apps))), icon="fa-solid fa-award", color="#FF9500"),
+    
+    # Must-have apps
+    create_app_collection("Essential Apps", _rng.sample(all_apps, min(6, len(all_apps))), icon="fa-solid fa-star", color="#5856D6")
+])
+
+# Apps tab - all apps by department
+_APPS_LAYOUT = html.Div([
+    # Department apps
+    *[create_app_collection(
+        f"{dept} Apps", 
+        apps_by_dept[dept], 
+        icon=dept_icons.get(dept, 'fa-solid fa-folder'),
+        color=icon_colors.get(dept),
+        dept=dept
+    ) for dept in departments]
+])
+
+# Apps for a single selected category
+# Create the page listing every app in one category
+def create_category_layout(dept):
+    return html.Div([
+        # Back button to return to categories
+        html.Button([
+            html.I(className="fas fa-arrow-left me-2"),
+            "Back to Categories"
+        ], 
+        id="back-to-categories", 
+        className="btn btn-light mb-4",
+        n_clicks=0),
+        # Department header with icon
+        html.Div([
+            html.I(className=dept_icons.get(dept, 'fa-solid fa-folder'), 
+                   style={"color": icon_colors.get(dept, '#4a6fa5'), "fontSize": "2rem", "marginRight": "15px"}),
+            html.H2(f"{dept} Applications", className="mb-0")
+        ], className="d-flex align-items-center mb-4"),
+        # Show the apps for this category
+        html.Div([
+            create_app_card(app_item, dept) for app_item in apps_by_dept[dept]
+        ], className="row g-4")
+    ])
+
+# Category pages only depend on config, so each one is serialized to plain
+# JSON data the first time it is opened and then reused - the callback returns
+# it without walking the component tree, and unvisited categories cost nothing
+_CATEGORY_NAMES = frozenset(departments)
+_CATEGORY_LAYOUTS = {}
+
+def get_category_layout(dept):
+    layout = _CATEGORY_LAYOUTS.get(dept)
+    if layout is None:
+        layout = _CATEGORY_LAYOUTS[dept] = json.loads(json.dumps(create_category_layout(dept), cls=PlotlyJSONEncoder))
+    return layout
+
 # App layout with div container properly set up
 app.layout = html.Div([
     dcc.Location(id="url"),
@@ -730,9 +573,18 @@ app.layout = html.Div([
     footer
 ])
 
-# Callback to populate tab content based on active tab
+# Callback outputs for each main tab, looked up instead of compared in turn
+_TAB_OUTPUTS = {
+    "tab-today": (_VISIBLE, _HIDDEN, None),
+    "tab-apps": (_HIDDEN, _VISIBLE, None),
+}
+_NO_TAB_OUTPUT = (_HIDDEN, _HIDDEN, html.Div("Please select a tab."))
+
+# Callback to show the content for the active tab or selected category
 @app.callback(
-    Output("tab-content", "children"),
+    [Output("today-content", "style"),
+     Output("apps-content", "style"),
+     Output("category-content", "children")],
     [Input("main-tabs", "active_tab"),
      Input("selected-category", "data")]
 )
@@ -742,98 +594,49 @@ def render_tab_content(active_tab, selected_category):
     # Check if the callback was triggered by a category selection
     if ctx.triggered and ctx.triggered[0]['prop_id'] == 'selected-category.data' and selected_category:
         # Show apps for the selected category
-        dept = selected_category  # The selected department name
-        if dept in departments:
-            return html.Div([
-                # Back button to return to categories
-                html.Button([
-                    html.I(className="fas fa-arrow-left me-2"),
-                    "Back to Categories"
-                ], 
-                id="back-to-categories", 
-                className="btn btn-light mb-4",
-                n_clicks=0),
-                # Department header with icon
-                html.Div([
-                    html.I(className=next((d.get('icon', 'fa-solid fa-folder') 
-                                         for d in config.get('departments', []) 
-                                         if d['name'] == dept), 
-                                         'fa-solid fa-folder'), 
-                           style={"color": icon_colors.get(dept, '#4a6fa5'), "fontSize": "2rem", "marginRight": "15px"}),
-                    html.H2(f"{dept} Applications", className="mb-0")
-                ], className="d-flex align-items-center mb-4"),
-                # Show the apps for this category
-                html.Div([
-                    create_app_card(app_item, dept) for app_item in apps_by_dept[dept]
-                ], className="row g-4")
-            ])
+        if selected_category in _CATEGORY_NAMES:
+            return _HIDDEN, _HIDDEN, get_category_layout(selected_category)
     
-    # Otherwise show the regular tab content
-    if active_tab == "tab-today":
-        # Today tab - featured content and editorial
-        return html.Div([
-            # Hero section
-            html.Div([
-                html.Div([
-                    html.Span("WELCOME TO", className="tag"),
-                    html.H1(app_store_title, className="display-5 mb-3 text-white"),
-                    html.P(app_store_description, className="lead text-white-50"),
-                ], className="col-md-8 py-5 px-4")
-            ], className="mb-4 rounded-3", style={
-                "background": "linear-gradient(135deg, #1565C0 0%, #0D47A1 100%)",
-                "borderRadius": "12px"
-            }),
-            
-            # Today's picks
-            html.H3("Today's Picks", className="collection-title mb-4"),
-            html.Div([
-                create_today_card("AI for Finance", "Optimize your financial operations with these AI-powered tools", "#2E7D32"),
-                create_today_card("Marketing Intelligence", "Enhance your marketing strategies with AI insights", "#C62828"),
-                create_today_card("Smarter Operations", "Streamline your operations with intelligent automation", "#0277BD")
-            ], className="horizontal-scroll px-2"),
-            
-            # Featured apps section
-            html.H3("Featured Apps", className="collection-title mb-4 mt-4"),
-            html.Div([
-                create_featured_app_card(app_item) for app_item in featured_apps[:3]
-            ], className="horizontal-scroll px-2"),
-            
-            # Editor's choice
-            create_app_collection("Editor's Choice", random.sample(all_apps, min(6, len(all_apps))), icon="fa-solid fa-award", color="#FF9500"),
-            
-            # Must-have apps
-            create_app_collection("Essential Apps", random.sample(all_apps, min(6, len(all_apps))), icon="fa-solid fa-star", color="#5856D6")
-        ])
-    
-    elif active_tab == "tab-apps":
-        # Apps tab - all apps by department
-        return html.Div([
-            # Department apps
-            *[create_app_collection(
-                f"{dept} Apps", 
-                apps_by_dept[dept], 
-                icon=next((d.get('icon', 'fa-solid fa-folder') for d in config.get('departments', []) if d['name'] == dept), 'fa-solid fa-folder'),
-                color=icon_colors.get(dept),
-                dept=dept
-            ) for dept in departments]
-        ])
-    
-    # Default - if no tab selected
-    return html.Div("Please select a tab.")
-
-# Callback to toggle the navbar collapse on small screens
-@app.callback(
+    # Otherwise show the regular tab content, defaulting to a prompt if no tab is selected
+    return _TAB_OUTPUTS.get(active_tab, _NO_TAB_OUTPUT)
+
+# Toggle the navbar collapse on small screens in the browser
+app.clientside_callback(
+    """
+    function(n, is_open) {
+        return n ? !is_open : is_open;
+    }
+    """,
     Output("navbar-collapse", "is_open"),
-    [Input("navbar-toggler", "n_clicks")],
-    [State("navbar-collapse", "is_open")],
+    Input("navbar-toggler", "n_clicks"),
+    State("navbar-collapse", "is_open")
 )
-def toggle_navbar_collapse(n, is_open):
-    if n:
-        return not is_open
-    return is_open
 
-# Callback to handle bottom tab bar clicks
-@app.callback(
+# Main tab and bottom bar classes for each bottom tab link. Updates and Search
+# just show the apps tab for the demo.
+_BOTTOM_TAB_LINKS = {
+    "tab-link-today": "tab-today",
+    "tab-link-apps": "tab-apps",
+    "tab-link-updates": "tab-apps",
+    "tab-link-search": "tab-apps",
+}
+_BOTTOM_TAB_STATES = {
+    link_id: (active_tab, *("tab-item active" if other == link_id else "tab-item" for other in _BOTTOM_TAB_LINKS))
+    for link_id, active_tab in _BOTTOM_TAB_LINKS.items()
+}
+
+# Handle bottom tab bar clicks in the browser - the result only depends on
+# which link was clicked, so look it up in the same table client-side
+app.clientside_callback(
+    f"""
+    function(todayClicks, appsClicks, updatesClicks, searchClicks) {{
+        const states = {json.dumps(_BOTTOM_TAB_STATES)};
+        const triggered = dash_clientside.callback_context.triggered;
+        const clickedId = triggered.length ? triggered[0].prop_id.split('.')[0] : null;
+        // If no click, default to today tab
+        return states[clickedId] || states["tab-link-today"];
+    }}
+    """,
     [Output("main-tabs", "active_tab"),
      Output("tab-link-today", "className"),
      Output("tab-link-apps", "className"),
@@ -844,36 +647,6 @@ def toggle_navbar_collapse(n, is_open):
      Input("tab-link-updates", "n_clicks"),
      Input("tab-link-search", "n_clicks")]
 )
-def handle_bottom_tabs(today_clicks, apps_clicks, updates_clicks, search_clicks):
-    ctx = dash.callback_context
-    
-    # If no click, default to today tab
-    if not ctx.triggered:
-        return "tab-today", "tab-item active", "tab-item", "tab-item", "tab-item"
-    
-    # Get ID of clicked button
-    clicked_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    # Set active tab and classes
-    active_tab = "tab-today"  # Default
-    classes = ["tab-item", "tab-item", "tab-item", "tab-item"]
-    
-    if clicked_id == "tab-link-today":
-        active_tab = "tab-today"
-        classes[0] = "tab-item active"
-    elif clicked_id == "tab-link-apps":
-        active_tab = "tab-apps"
-        classes[1] = "tab-item active"
-    elif clicked_id == "tab-link-updates":
-        # For demo, we'll just show the apps tab
-        active_tab = "tab-apps"
-        classes[2] = "tab-item active"
-    elif clicked_id == "tab-link-search":
-        # For demo, we'll just show the apps tab
-        active_tab = "tab-apps"
-        classes[3] = "tab-item active"
-    
-    return active_tab, classes[0], classes[1], classes[2], classes[3]
 
 if __name__ == '__main__':
     # Get port from environment variable or default to 8050
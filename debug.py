@@ -24,6 +24,7 @@ import sys
 import os
 import argparse
 import importlib
+import importlib.util
 from utils.log import get_logger  # Use the centralized logging module
 
 # Set up logging for debugging
@@ -63,9 +64,15 @@ def run_app(app_name, port, debug_mode):
     module_name = PORTAL_VERSIONS[app_name]
     
     try:
-        # Dynamically import the module
-        logger.info(f"Importing {module_name}...")
-        module = importlib.import_module(module_name)
+        # Reuse the module if it's already loaded, so its config load and layout
+        # build don't run twice; otherwise check it exists before importing it
+        module = sys.modules.get(module_name)
+        if module is None:
+            if importlib.util.find_spec(module_name) is None:
+                logger.error(f"Could not import {module_name}. Make sure the file exists.")
+                sys.exit(1)
+            logger.info(f"Importing {module_name}...")
+            module = importlib.import_module(module_name)
         
         # Get the Dash app instance
         # Most modules use dash_app, but check for app as fallback
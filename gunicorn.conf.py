@@ -0,0 +1,12 @@
+"""
+Gunicorn configuration for the Enterprise AI Portal.
+
+Picked up automatically from the working directory by start.sh. Worker count,
+threads, bind address and the other runtime flags are passed on the command
+line by start.sh (WORKERS, WORKER_THREADS, ...), which takes precedence over
+this file, so only settings start.sh doesn't pass belong here.
+"""
+
+# Import the portal module once in the master before forking, so the parsed
+# config and the Dash layout tree are shared copy-on-write by every worker
+preload_app = True
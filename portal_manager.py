@@ -10,10 +10,11 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import subprocess
 import threading
-import yaml
 import webbrowser
 from datetime import datetime
 
+from utils.portal_utils import load_config as shared_load_config
+
 class PortalManager:
     def __init__(self, root):
         self.root = root
@@ -84,9 +85,7 @@ class PortalManager:
         """Load configuration from YAML file"""
         config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
         try:
-            with open(config_path, 'r') as file:
-                config = yaml.safe_load(file)
-            return config
+            return shared_load_config(config_path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load configuration: {e}")
             return {}
@@ -10,10 +10,13 @@ from dash import dcc, html
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output
 import os
-import yaml
 import logging
 import sys
 
+# Make the project's utils package importable when run from tests/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.portal_utils import load_config as shared_load_config
+
 # Configure logging similar to app_bytab.py
 logging.basicConfig(
     level=logging.DEBUG,
@@ -28,8 +31,7 @@ logger = logging.getLogger('test_copilot')
 def load_config():
     config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
     try:
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
+        config = shared_load_config(config_path)
         logger.info(f"Config loaded successfully with {len(config.keys())} top level keys")
         return config
     except Exception as e:
@@ -8,9 +8,13 @@ UI components, routing, and callbacks.
 
 import unittest
 import os
+import json
 import sys
 import yaml
+import pickle
+import tempfile
 from unittest.mock import patch, MagicMock
+from plotly.utils import PlotlyJSONEncoder
 
 # Add additional imports for testing Dash apps
 from dash.testing.application_runners import import_app
@@ -90,6 +94,181 @@ class ConfigurationTests(BasePortalTestCase):
                          f"App should have '{field}' field")
 
 
+class SharedConfigLoaderTests(unittest.TestCase):
+    """Tests for the cached loader in utils.portal_utils."""
+    
+    def setUp(self):
+        # The tests may run from tests/ or from a copy in the project root
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        if not os.path.isdir(os.path.join(base_dir, 'utils')):
+            base_dir = os.path.dirname(base_dir)
+        sys.path.insert(0, base_dir)
+        from utils import portal_utils
+        self.portal_utils = portal_utils
+        self.portal_utils._load_config_cached.cache_clear()
+        
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmp_dir.name, 'config.yaml')
+        self.write_config("Acme")
+    
+    def tearDown(self):
+        self.portal_utils._load_config_cached.cache_clear()
+        self.tmp_dir.cleanup()
+    
+    def write_config(self, company_name, mtime_ns=None):
+        """Write a minimal config, optionally backdating its mtime like cp -p would."""
+        with open(self.config_path, 'w') as file:
+            yaml.safe_dump({'title': 'Portal', 'company': {'name': company_name}}, file)
+        if mtime_ns is not None:
+            os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+    
+    def test_cache_hit(self):
+        """Test that an unchanged file is parsed once per process."""
+        first = self.portal_utils.load_config(self.config_path)
+        second = self.portal_utils.load_config(self.config_path)
+        self.assertIs(first, second)
+    
+    def test_invalidated_by_edit_with_older_mtime(self):
+        """Test that an edit is picked up even when it carries an older mtime."""
+        old_mtime_ns = os.stat(self.config_path).st_mtime_ns
+        self.assertEqual(self.portal_utils.load_config(self.config_path)['company']['name'], "Acme")
+        
+        self.write_config("Globex Corporation", mtime_ns=old_mtime_ns - 3600 * 10**9)
+        self.assertEqual(self.portal_utils.load_config(self.config_path)['company']['name'],
+                         "Globex Corporation")
+        
+        # A fresh process must not be served the stale sidecar either
+        self.portal_utils._load_config_cached.cache_clear()
+        self.assertEqual(self.portal_utils.load_config(self.config_path)['company']['name'],
+                         "Globex Corporation")
+    
+    def test_sidecar_reused_when_source_matches(self):
+        """Test that a new process reuses the pickled parse instead of the YAML."""
+        self.portal_utils.load_config(self.config_path)
+        self.portal_utils._load_config_cached.cache_clear()
+        
+        with patch.object(self.portal_utils.yaml, 'load', side_effect=AssertionError("YAML parsed")):
+            config = self.portal_utils.load_config(self.config_path)
+        self.assertEqual(config['company']['name'], "Acme")
+    
+    def test_sidecar_rejected_when_source_changed(self):
+        """Test that a sidecar recorded for another mtime/size is ignored and rewritten."""
+        self.portal_utils.load_config(self.config_path)
+        self.portal_utils._load_config_cached.cache_clear()
+        
+        self.write_config("Initech")
+        config = self.portal_utils.load_config(self.config_path)
+        self.assertEqual(config['company']['name'], "Initech")
+        
+        stat = os.stat(self.config_path)
+        with open(f"{self.config_path}.pkl", 'rb') as cache_file:
+            source_key, cached_config = pickle.load(cache_file)
+        self.assertEqual(source_key, (stat.st_mtime_ns, stat.st_size))
+        self.assertEqual(cached_config['company']['name'], "Initech")
+    
+    def test_invalid_yaml_raises(self):
+        """Test that a malformed config is reported instead of loading as empty."""
+        with open(self.config_path, 'w') as file:
+            file.write("company: [unclosed\n")
+        with self.assertRaises(yaml.YAMLError):
+            self.portal_utils.load_config(self.config_path)
+    
+    def test_old_format_sidecar_ignored(self):
+        """Test that a sidecar without a source key is treated as a miss."""
+        with open(f"{self.config_path}.pkl", 'wb') as cache_file:
+            pickle.dump({'company': {'name': "Stale"}}, cache_file)
+        self.assertEqual(self.portal_utils.load_config(self.config_path)['company']['name'], "Acme")
+
+
+class TabCacheTests(unittest.TestCase):
+    """Tests for the on-disk cache behind app_bytab.load_tab_json."""
+    
+    def setUp(self):
+        # The tests may run from tests/ or from a copy in the project root
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        if not os.path.isdir(os.path.join(base_dir, 'utils')):
+            base_dir = os.path.dirname(base_dir)
+        sys.path.insert(0, base_dir)
+        from utils import portal_utils
+        self.portal_utils = portal_utils
+        
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmp_dir.name, 'config.yaml')
+        self.module_path = os.path.join(self.tmp_dir.name, 'app_bytab.py')
+        self.cache_path = os.path.join(self.tmp_dir.name, '.portal_cache.pkl')
+        for path in (self.config_path, self.module_path):
+            with open(path, 'w') as file:
+                file.write("initial\n")
+        self.builds = 0
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def build_tabs(self):
+        self.builds += 1
+        return {'tab-finance': {'type': 'Div', 'props': {'children': f"build {self.builds}"}}}
+    
+    def load_tabs(self):
+        """Load the tabs the same way load_tab_json does."""
+        cache_key = (self.portal_utils.render_cache_key(self.config_path, self.module_path),
+                     ('tab-finance',))
+        return self.portal_utils.load_pickle_cache(self.cache_path, cache_key, self.build_tabs)
+    
+    def test_cache_hit(self):
+        """Test that unchanged sources reuse the cached tabs."""
+        first = self.load_tabs()
+        second = self.load_tabs()
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(first, second)
+    
+    def test_miss_after_config_change(self):
+        """Test that editing config.yaml rebuilds the tabs, even with an older mtime."""
+        self.load_tabs()
+        old_mtime_ns = os.stat(self.config_path).st_mtime_ns
+        with open(self.config_path, 'w') as file:
+            file.write("edited config\n")
+        os.utime(self.config_path, ns=(old_mtime_ns - 3600 * 10**9,) * 2)
+        self.assertEqual(self.load_tabs()['tab-finance']['props']['children'], "build 2")
+    
+    def test_miss_after_module_change(self):
+        """Test that editing the portal module rebuilds the tabs."""
+        self.load_tabs()
+        with open(self.module_path, 'w') as file:
+            file.write("edited module\n")
+        self.load_tabs()
+        self.assertEqual(self.builds, 2)
+    
+    def test_miss_after_library_upgrade(self):
+        """Test that a dash or dash-bootstrap-components upgrade rebuilds the tabs."""
+        self.load_tabs()
+        with patch.object(self.portal_utils.dash, '__version__', '0.0.0-upgraded'):
+            self.load_tabs()
+        with patch.object(self.portal_utils.dbc, '__version__', '0.0.0-upgraded'):
+            self.load_tabs()
+        self.assertEqual(self.builds, 3)
+    
+    def test_recovers_from_corrupt_cache(self):
+        """Test that a truncated or corrupt cache file is rebuilt and rewritten."""
+        self.load_tabs()
+        with open(self.cache_path, 'rb') as cache_file:
+            data = cache_file.read()
+        for broken in (data[:len(data) // 2], b"not a pickle", b""):
+            with open(self.cache_path, 'wb') as cache_file:
+                cache_file.write(broken)
+            self.assertIn('tab-finance', self.load_tabs())
+        self.assertEqual(self.builds, 4)
+        
+        # The rebuilt cache is valid again
+        self.load_tabs()
+        self.assertEqual(self.builds, 4)
+    
+    def test_cache_written_atomically(self):
+        """Test that writing the cache leaves no temporary files behind."""
+        self.load_tabs()
+        self.assertEqual(sorted(os.listdir(self.tmp_dir.name)),
+                         ['.portal_cache.pkl', 'app_bytab.py', 'config.yaml'])
+
+
 class OriginalAppTests(BasePortalTestCase):
     """Tests for the original app.py version."""
     
@@ -223,6 +402,72 @@ class TabbedAppTests(BasePortalTestCase):
                           "Tabbed app should have tab callback registered")
 
 
+class AppStoreTests(unittest.TestCase):
+    """Tests for the cached App Store cards, category pages and tab dispatch."""
+    
+    @classmethod
+    def setUpClass(cls):
+        # The tests may run from tests/ or from a copy in the project root
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        if not os.path.isdir(os.path.join(base_dir, 'utils')):
+            base_dir = os.path.dirname(base_dir)
+        sys.path.insert(0, base_dir)
+        import app_store
+        cls.app_store = app_store
+    
+    def setUp(self):
+        self.app_store._CATEGORY_LAYOUTS.clear()
+        self.dept = self.app_store.departments[0]
+    
+    def test_category_layout_built_once(self):
+        """Test that a category page is built on first use and then reused."""
+        with patch.object(self.app_store, 'create_category_layout',
+                          wraps=self.app_store.create_category_layout) as create:
+            first = self.app_store.get_category_layout(self.dept)
+            second = self.app_store.get_category_layout(self.dept)
+        self.assertEqual(create.call_count, 1)
+        self.assertIs(first, second)
+    
+    def test_category_layout_matches_eager_render(self):
+        """Test that the cached JSON matches serializing a freshly built page."""
+        eager = json.loads(json.dumps(self.app_store.create_category_layout(self.dept),
+                                      cls=PlotlyJSONEncoder))
+        self.assertEqual(self.app_store.get_category_layout(self.dept), eager)
+    
+    def test_app_card_keyed_by_department_and_name(self):
+        """Test that cards are reused for an equal app dict, e.g. after a config reload."""
+        app_item = self.app_store.apps_by_dept[self.dept][0]
+        card = self.app_store.create_app_card(app_item, self.dept)
+        self.assertIs(self.app_store.create_app_card(dict(app_item), self.dept), card)
+        
+        other_item = self.app_store.apps_by_dept[self.dept][1]
+        self.assertIsNot(self.app_store.create_app_card(other_item, self.dept), card)
+    
+    def test_each_tab_shows_exactly_one_container(self):
+        """Test that every main tab shows exactly one of the Today/Apps containers."""
+        visible = self.app_store._VISIBLE
+        for tab_id, (today_style, apps_style, category) in self.app_store._TAB_OUTPUTS.items():
+            self.assertEqual([today_style, apps_style].count(visible), 1,
+                             f"{tab_id} should show exactly one container")
+            self.assertIsNone(category, f"{tab_id} should clear the category page")
+        
+        today_style, apps_style, _ = self.app_store._NO_TAB_OUTPUT
+        self.assertNotIn(visible, [today_style, apps_style])
+    
+    def test_bottom_tabs_target_known_tabs(self):
+        """Test that the bottom tab bar only switches to tabs the dispatch table knows."""
+        for link_id, tab_id in self.app_store._BOTTOM_TAB_LINKS.items():
+            self.assertIn(tab_id, self.app_store._TAB_OUTPUTS,
+                          f"{link_id} targets unknown tab {tab_id}")
+            self.assertEqual(self.app_store._BOTTOM_TAB_STATES[link_id][0], tab_id)
+    
+    def test_bottom_tab_script_generated_from_python_table(self):
+        """Test that the clientside bottom tab table is the serialized Python table."""
+        table_json = json.dumps(self.app_store._BOTTOM_TAB_STATES)
+        self.assertTrue(any(table_json in script for script in self.app_store.app._inline_scripts),
+                        "Clientside callback should embed _BOTTOM_TAB_STATES")
+
+
 class PortalUtilitiesTest(BasePortalTestCase):
     """Tests for portal utility functions."""
     
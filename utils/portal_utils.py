@@ -14,17 +14,151 @@ COPILOT INSTRUCTIONS:
 
 import os
 import yaml
+import pickle
 import logging
-from typing import Dict, List, Any, Optional, Union
+import tempfile
+import functools
+from typing import Callable, Dict, List, Any, Optional, Union
 import dash
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Only a few parses are kept alive at once, so editing config.yaml doesn't
+# leave every superseded parse in memory for the life of the process
+_CONFIG_CACHE_SIZE = 4
+
+
+def write_pickle_atomic(path: str, obj: Any) -> None:
+    """
+    Pickle an object to a file so that readers only ever see a complete file.
+
+    The data is written to a uniquely named temporary file in the same
+    directory and then renamed over ``path``, so concurrent writers can't
+    truncate each other's output.
+
+    Args:
+        path: Destination file path.
+        obj: Object to pickle.
+
+    Raises:
+        OSError: If the directory isn't writable or the rename fails.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path),
+                                    prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        # mkstemp creates the file owner-only; keep it readable like config.yaml.
+        # os.chmod on the path works everywhere, unlike os.fchmod on Windows.
+        os.chmod(tmp_path, 0o644)
+        with os.fdopen(fd, 'wb') as tmp_file:
+            pickle.dump(obj, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def render_cache_key(*paths: str) -> tuple:
+    """
+    Build a cache key for Dash output rendered from the given source files.
+
+    The key changes whenever any source file's modification time or size
+    changes, or when dash or dash-bootstrap-components is upgraded, since
+    serialized component trees depend on the library versions.
+
+    Args:
+        *paths: Files the cached output is derived from.
+
+    Returns:
+        Hashable key to store alongside the cached output.
+
+    Raises:
+        OSError: If any of the files can't be stat'ed.
+    """
+    stats = [os.stat(path) for path in paths]
+    return (tuple((stat.st_mtime_ns, stat.st_size) for stat in stats),
+            dash.__version__, dbc.__version__)
+
+
+def load_pickle_cache(cache_path: str, cache_key: Any, build: Callable[[], Any]) -> Any:
+    """
+    Return the object pickled at ``cache_path`` under ``cache_key``, building it on a miss.
+
+    A missing, truncated or corrupt cache file, or one stored under a
+    different key, counts as a miss. On a miss the freshly built object is
+    written back with :func:`write_pickle_atomic`; failing to write the cache
+    is logged but not fatal.
+
+    Args:
+        cache_path: Path of the pickle cache file.
+        cache_key: Key the cached object must have been stored under.
+        build: Zero-argument function that builds the object on a miss.
+
+    Returns:
+        The cached or freshly built object.
+    """
+    logger = logging.getLogger('portal_utils')
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            cached_key, cached_value = pickle.load(cache_file)
+        if cached_key == cache_key:
+            return cached_value
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        pass  # Missing, truncated or corrupt cache - rebuild
+
+    value = build()
+    try:
+        write_pickle_atomic(cache_path, (cache_key, value))
+    except OSError as e:
+        logger.warning("Could not write cache %s: %s", cache_path, e)
+    return value
+
+
+@functools.lru_cache(maxsize=_CONFIG_CACHE_SIZE)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a configuration file once per (path, mtime, size) for the whole process.
+
+    A pickled copy of the parse is kept next to the YAML file together with
+    the (mtime_ns, size) of the YAML it came from, and is only reused while
+    both still match. A restored or copied config.yaml with an older mtime
+    therefore still invalidates it.
+
+    Args:
+        config_path: Absolute path to the configuration file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+
+    Returns:
+        Dictionary containing the configuration data, shared by every caller.
+    """
+    logger = logging.getLogger('portal_utils')
+
+    def parse_yaml():
+        # Slurp the raw bytes in one read and let the loader handle decoding
+        with open(config_path, 'rb') as file:
+            return yaml.load(file.read(), Loader=_YAML_LOADER)
+
+    config = load_pickle_cache(f"{config_path}.pkl", (mtime_ns, size), parse_yaml)
+    logger.info("Config loaded successfully with %d top level keys", len(config))
+    return config
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from a YAML file.
     
+    The parsed configuration is shared by every caller in the process until
+    the file changes, so treat it as read-only and copy anything you need
+    to modify.
+    
     Args:
         config_path: Path to the configuration file. If None, uses default path.
         
@@ -33,24 +167,26 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         
     Raises:
         FileNotFoundError: If the configuration file doesn't exist.
+        OSError: If the configuration file can't be read.
+        yaml.YAMLError: If the configuration file isn't valid YAML.
     """
     logger = logging.getLogger('portal_utils')
     
     if config_path is None:
         # Use default path relative to project root
         config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yaml')
+    config_path = os.path.abspath(config_path)
     
     try:
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-        logger.info(f"Config loaded successfully with {len(config.keys())} top level keys")
-        return config
+        stat = os.stat(config_path)
+        return _load_config_cached(config_path, stat.st_mtime_ns, stat.st_size)
     except FileNotFoundError:
         logger.error(f"Configuration file not found at: {config_path}")
         raise
     except Exception as e:
+        # Callers decide how to report a broken config, so don't mask it as empty
         logger.error(f"Error loading configuration: {e}")
-        return {}
+        raise
 
 
 def create_app_card(